@@ -1,24 +1,121 @@
 """Command-line interface for exif-frame-cli."""
 
-import os
 import sys
+from itertools import repeat
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Tuple
 
 import click
-from PIL import Image
 
-from .exif_reader import ExifReader
-from .frame_generator import FrameGenerator
 from .models import ExifData
 
+# Pillow and the frame generator are imported lazily so that --help and
+# --version don't pay for loading the imaging stack
+if TYPE_CHECKING:
+    from .frame_generator import FrameGenerator
+
+
+# Leading bytes of common image formats and the Pillow plugin that reads them
+_IMAGE_SIGNATURES = (
+    (b'\xff\xd8\xff', 'JPEG'),
+    (b'\x89PNG\r\n\x1a\n', 'PNG'),
+    (b'II*\x00', 'TIFF'),
+    (b'MM\x00*', 'TIFF'),
+    (b'BM', 'BMP'),
+    (b'GIF87a', 'GIF'),
+    (b'GIF89a', 'GIF'),
+)
+
+
+def _sniff_image_format(path: Path) -> Optional[str]:
+    """Identify common image formats from the file header without decoding it.
+    
+    Returns None for anything else; those files are left to Pillow to identify.
+    """
+    with open(path, 'rb') as f:
+        magic = f.read(12)
+    for signature, image_format in _IMAGE_SIGNATURES:
+        if magic.startswith(signature):
+            return image_format
+    if magic[:4] == b'RIFF' and magic[8:12] == b'WEBP':
+        return 'WEBP'
+    return None
+
+
+def _process_one(frame_generator: "FrameGenerator", task: Tuple[str, str, bool]) -> bool:
+    """Frame one (input_file, output_path, verbose) task with the given generator.
+    
+    Runs in the worker processes of FrameGenerator.generate_frames(). Returns True
+    on success; errors are reported to stderr.
+    """
+    from PIL import Image
+    
+    from .exif_reader import ExifReader
+    
+    input_file, output_path, verbose = task
+    input_path = Path(input_file)
+    if not input_path.exists():
+        click.echo(f"Error: Input file '{input_file}' does not exist.", err=True)
+        return False
+    
+    # Check if file is a supported image format. Only the header is read;
+    # corrupt pixel data surfaces later as a generation error.
+    try:
+        # A recognised signature goes straight to its plugin; other files (PPM,
+        # TGA, ...) go through Pillow's full format detection
+        image_format = _sniff_image_format(input_path)
+        # Open the image once; EXIF extraction and frame generation share the handle
+        image = Image.open(input_path, formats=[image_format] if image_format else None)
+    except Exception:
+        click.echo(f"Error: '{input_file}' is not a valid image file.", err=True)
+        return False
+    
+    with image:
+        if verbose:
+            click.echo(f"Processing: {input_path}")
+            click.echo(f"Output: {output_path}")
+        
+        # Extract EXIF data
+        try:
+            exif_reader = ExifReader(image)
+            exif_data = exif_reader.extract_exif_data()
+        except Exception as e:
+            click.echo(f"Error reading EXIF data: {e}", err=True)
+            # Continue with empty EXIF data
+            exif_data = ExifData()
+        
+        if verbose:
+            click.echo("\\nExtracted EXIF data:")
+            click.echo(f"  Camera: {exif_data.camera_full_name}")
+            click.echo(f"  Lens: {exif_data.lens_display_name}")
+            click.echo(f"  Settings: {exif_data.formatted_settings}")
+        
+        # Generate frame
+        try:
+            # The generator lives for the whole process, so recycle its canvases. The
+            # handle isn't needed afterwards, so a large JPEG may be draft-decoded in place.
+            framed_image = frame_generator.render_frame(image, exif_data, reuse_canvas=True, in_place=True)
+        except Exception as e:
+            click.echo(f"Error generating frame for '{input_file}': {e}", err=True)
+            return False
+    
+    # Encode after the source is closed, so its decoded pixels aren't held meanwhile
+    try:
+        result_path = frame_generator.save_frame(framed_image, output_path)
+    except Exception as e:
+        click.echo(f"Error generating frame for '{input_file}': {e}", err=True)
+        return False
+    
+    click.echo(f"✓ Frame generated successfully: {result_path}")
+    return True
+
 
 @click.command()
-@click.argument('input_file', type=click.Path(exists=True, dir_okay=False))
+@click.argument('input_files', nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
 @click.option(
     '--output', '-o',
     type=click.Path(),
-    help='Output file path. If not specified, adds "_framed" to input filename.'
+    help='Output file path, or output directory when several input files are given. If not specified, adds "_framed" to input filename.'
 )
 @click.option(
     '--style', '-s',
@@ -37,6 +134,27 @@ from .models import ExifData
     default=95,
     help='JPEG quality (1-100, default: 95).'
 )
+@click.option(
+    '--max-dimension',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Downscale images so the longest side is at most this many pixels. Large JPEGs are decoded at reduced scale, which is much faster.'
+)
+@click.option(
+    '--optimize/--no-optimize', '--optimize-coding', 'optimize',
+    default=False,
+    help='Optimize JPEG Huffman tables for slightly smaller files at the cost of slower encoding (default: off).'
+)
+@click.option(
+    '--fast',
+    is_flag=True,
+    help='Favor encoding speed: 4:2:0 chroma subsampling and no Huffman optimization, even at high quality.'
+)
+@click.option(
+    '--png-palette',
+    is_flag=True,
+    help='Quantize PNG output to a 256-color palette for much smaller files (best for screenshots and graphics).'
+)
 @click.option(
     '--font-scale',
     type=click.FloatRange(0.5, 3.0),
@@ -66,72 +184,81 @@ from .models import ExifData
     default='2.35',
     help='Cinescope aspect ratio (default: 2.35:1).'
 )
+@click.option(
+    '--jobs', '-j',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Number of worker processes when several files are given (default: number of CPUs).'
+)
 @click.version_option()
-def main(input_file: str, output: Optional[str], style: str, verbose: bool, quality: int, font_scale: float, theme: str, layout: str, cinescope: bool, aspect_ratio: str):
+def main(input_files: Tuple[str, ...], output: Optional[str], style: str, verbose: bool, quality: int, max_dimension: Optional[int], optimize: bool, fast: bool, png_palette: bool, font_scale: float, theme: str, layout: str, cinescope: bool, aspect_ratio: str, jobs: Optional[int]):
     """Create instant camera-style frames for digital photos using EXIF metadata.
     
-    INPUT_FILE: Path to the image file to process.
+    INPUT_FILES: Path(s) to the image file(s) to process.
     """
     try:
-        # Validate input file
-        input_path = Path(input_file)
-        if not input_path.exists():
-            click.echo(f"Error: Input file '{input_file}' does not exist.", err=True)
-            sys.exit(1)
+        batch = len(input_files) > 1
         
-        # Check if file is a supported image format
-        try:
-            with Image.open(input_path) as img:
-                img.verify()
-        except Exception:
-            click.echo(f"Error: '{input_file}' is not a valid image file.", err=True)
-            sys.exit(1)
+        # Determine output paths
+        output_paths = []
+        output_sources = {}
+        resolved_inputs = {Path(input_file).resolve(): input_file for input_file in input_files}
+        for input_file in input_files:
+            input_path = Path(input_file)
+            framed_name = f"{input_path.stem}_framed{input_path.suffix}"
+            if output is None:
+                output_path = input_path.parent / framed_name
+            elif batch:
+                # Several inputs: --output names a directory
+                output_path = Path(output) / framed_name
+            else:
+                output_path = Path(output)
+            # Inputs with the same name from different directories (or the same file
+            # given twice) would overwrite each other's output
+            resolved_output = output_path.resolve()
+            if resolved_output in output_sources:
+                click.echo(f"Error: '{output_sources[resolved_output]}' and '{input_file}' would both be written to '{output_path}'.", err=True)
+                sys.exit(1)
+            # Writing over an input would truncate it while it may still be read,
+            # e.g. a re-run over photos/*.jpg that picks up earlier *_framed.jpg files
+            if resolved_output in resolved_inputs:
+                click.echo(f"Error: output '{output_path}' for '{input_file}' would overwrite input '{resolved_inputs[resolved_output]}'.", err=True)
+                sys.exit(1)
+            output_sources[resolved_output] = input_file
+            output_paths.append(str(output_path))
         
-        # Determine output path
-        if output is None:
-            output_path = input_path.parent / f"{input_path.stem}_framed{input_path.suffix}"
-        else:
-            output_path = Path(output)
-            # Ensure output directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure output directories exist, once every path is known to be distinct
+        for output_path in output_paths:
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         
         if verbose:
-            click.echo(f"Processing: {input_path}")
-            click.echo(f"Output: {output_path}")
             click.echo(f"Style: {style}")
             click.echo(f"Theme: {theme}")
             click.echo(f"Layout: {layout}")
             click.echo(f"Quality: {quality}")
+            click.echo(f"Optimize: {optimize}")
+            if fast:
+                click.echo("Fast encoding: enabled")
+            if png_palette:
+                click.echo("PNG palette: enabled")
+            if max_dimension:
+                click.echo(f"Max dimension: {max_dimension}px")
+            from PIL import features
+            click.echo(f"JPEG encoder: {'libjpeg-turbo' if features.check_feature('libjpeg_turbo') else 'libjpeg'}")
             click.echo(f"Font scale: {font_scale}")
             if cinescope:
                 click.echo(f"Cinescope: enabled ({aspect_ratio}:1)")
         
-        # Extract EXIF data
-        try:
-            exif_reader = ExifReader(str(input_path))
-            exif_data = exif_reader.extract_exif_data()
-        except Exception as e:
-            click.echo(f"Error reading EXIF data: {e}", err=True)
-            # Continue with empty EXIF data
-            exif_data = ExifData()
+        from .frame_generator import FrameGenerator
         
-        if verbose:
-            click.echo("\\nExtracted EXIF data:")
-            click.echo(f"  Camera: {exif_data.camera_full_name}")
-            click.echo(f"  Lens: {exif_data.lens_display_name}")
-            click.echo(f"  Settings: {exif_data.format_settings()}")
+        # Images are independent, so they are framed in parallel worker processes,
+        # each reusing one generator so fonts and text stay cached between files
+        frame_generator = FrameGenerator(style=style, quality=quality, font_scale=font_scale, theme=theme, layout=layout, cinescope=cinescope, aspect_ratio=float(aspect_ratio), optimize=optimize, max_dimension=max_dimension, fast=fast, png_palette=png_palette)
+        results = frame_generator.generate_frames(
+            zip(input_files, output_paths, repeat(verbose)), jobs=jobs, frame_func=_process_one
+        )
         
-        # Generate frame
-        try:
-            frame_generator = FrameGenerator(style=style, quality=quality, font_scale=font_scale, theme=theme, layout=layout, cinescope=cinescope, aspect_ratio=float(aspect_ratio))
-            result_path = frame_generator.generate_frame(
-                str(input_path), exif_data, str(output_path)
-            )
-            
-            click.echo(f"✓ Frame generated successfully: {result_path}")
-            
-        except Exception as e:
-            click.echo(f"Error generating frame: {e}", err=True)
+        if not all(results):
             sys.exit(1)
             
     except KeyboardInterrupt:
@@ -1,10 +1,9 @@
 """EXIF data extraction from images."""
 
-from typing import Optional
-from fractions import Fraction
+from typing import Optional, Union
 
 from PIL import Image
-from PIL.ExifTags import TAGS
+from PIL.ExifTags import IFD, Base
 
 from .models import ExifData
 
@@ -12,20 +11,25 @@ from .models import ExifData
 class ExifReader:
     """Extract EXIF metadata from image files."""
     
-    def __init__(self, image_path: str):
-        self.image_path = image_path
-        self.image = Image.open(image_path)
-        self.exif_dict = self._get_exif_dict()
+    def __init__(self, image: Union[str, Image.Image]):
+        # Accept an already-opened image so callers don't have to re-open the file
+        if isinstance(image, Image.Image):
+            self.image_path = getattr(image, 'filename', None)
+            self.image = image
+        else:
+            self.image_path = image
+            self.image = Image.open(image)
+        # getexif() parses the EXIF block once and caches it on the image
+        self._exif = self.image.getexif()
+        # Camera settings live in the Exif sub-IFD, not in IFD0
+        self._exif_ifd = self._exif.get_ifd(IFD.Exif)
     
-    def _get_exif_dict(self) -> dict:
-        """Extract EXIF data as a dictionary."""
-        exif_data = {}
-        if hasattr(self.image, '_getexif') and self.image._getexif() is not None:
-            exif = self.image._getexif()
-            for tag_id, value in exif.items():
-                tag = TAGS.get(tag_id, tag_id)
-                exif_data[tag] = value
-        return exif_data
+    def _get_tag(self, tag: Base):
+        """Look up a tag by numeric id in the Exif sub-IFD, falling back to IFD0."""
+        value = self._exif_ifd.get(tag)
+        if value is None:
+            value = self._exif.get(tag)
+        return value
     
     def _format_shutter_speed(self, shutter_speed) -> Optional[str]:
         """Format shutter speed from EXIF data."""
@@ -86,13 +90,14 @@ class ExifReader:
     
     def extract_exif_data(self) -> ExifData:
         """Extract and format EXIF data into ExifData object."""
+        iso = self._get_tag(Base.ISOSpeedRatings)
         return ExifData(
-            camera_make=self.exif_dict.get('Make'),
-            camera_model=self.exif_dict.get('Model'),
-            lens_model=self.exif_dict.get('LensModel'),
-            focal_length=self._format_focal_length(self.exif_dict.get('FocalLength')),
-            aperture=self._format_aperture(self.exif_dict.get('FNumber')),
-            shutter_speed=self._format_shutter_speed(self.exif_dict.get('ExposureTime')),
-            iso=str(self.exif_dict.get('ISOSpeedRatings', '')) if self.exif_dict.get('ISOSpeedRatings') else None,
-            datetime_original=self.exif_dict.get('DateTimeOriginal')
+            camera_make=self._get_tag(Base.Make),
+            camera_model=self._get_tag(Base.Model),
+            lens_model=self._get_tag(Base.LensModel),
+            focal_length=self._format_focal_length(self._get_tag(Base.FocalLength)),
+            aperture=self._format_aperture(self._get_tag(Base.FNumber)),
+            shutter_speed=self._format_shutter_speed(self._get_tag(Base.ExposureTime)),
+            iso=str(iso) if iso else None,
+            datetime_original=self._get_tag(Base.DateTimeOriginal)
         )
\ No newline at end of file
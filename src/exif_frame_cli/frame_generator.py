@@ -1,37 +1,191 @@
 """Frame generation for instant camera-style photos."""
 
-from typing import Tuple
-from PIL import Image, ImageDraw, ImageFont
+import os
+import shutil
+import subprocess
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from PIL import ExifTags, Image, ImageDraw, ImageOps, features
+from .exif_reader import ExifReader
 from .models import ExifData
 
 
+# Try more stylish fonts first
+_BOLD_FONTS = (
+    "HelveticaNeue-Medium.ttc",   # macOS Helvetica Neue Medium
+    "HelveticaNeue-Bold.ttc",     # macOS Helvetica Neue Bold
+    "Helvetica-Bold.ttc",         # macOS Helvetica Bold
+    "SF-Pro-Display-Medium.otf",  # macOS San Francisco Medium
+    "Roboto-Medium.ttf",          # Google Roboto Medium
+    "Inter-Medium.ttf",           # Inter Medium
+    "Lato-Bold.ttf",              # Lato Bold
+    "Arial-Bold.ttf",             # Fallback Arial Bold
+    "DejaVuSans-Bold.ttf",        # Linux fallback Bold
+)
+
+_REGULAR_FONTS = (
+    "HelveticaNeue-Light.ttc",    # macOS Helvetica Neue Light
+    "Helvetica Neue.ttc",         # macOS Helvetica Neue
+    "Helvetica.ttc",              # macOS Helvetica
+    "SF-Pro-Display-Light.otf",   # macOS San Francisco Light
+    "Roboto-Light.ttf",           # Google Roboto Light
+    "Inter-Light.ttf",            # Inter Light
+    "Lato-Light.ttf",             # Lato Light
+    "Arial.ttf",                  # Fallback Arial
+    "DejaVuSans.ttf",             # Linux fallback
+)
+
+
+# Common system font directories, checked directly before Pillow's recursive font search
+_FONT_DIRS = (
+    "/System/Library/Fonts",                                        # macOS system fonts
+    "/Library/Fonts",                                               # macOS shared fonts
+    os.path.expanduser("~/Library/Fonts"),                          # macOS user fonts
+    "/usr/share/fonts/truetype/dejavu",                             # Debian/Ubuntu DejaVu
+    "/usr/share/fonts/dejavu",                                      # Fedora DejaVu
+    "/usr/share/fonts/TTF",                                         # Arch Linux
+    os.path.join(os.environ.get("WINDIR", "C:/Windows"), "Fonts"),  # Windows
+)
+
+
+# Frame color, primary text color and secondary text color for each theme
+_THEMES = {
+    "white": ((255, 255, 255), (0, 0, 0), (100, 100, 100)),        # White background, black / dark gray text
+    "black": ((0, 0, 0), (255, 255, 255), (180, 180, 180)),        # Black background, white / light gray text
+}
+
+
+# Pillow text anchors for each horizontal alignment (top of ascender as vertical reference)
+_ANCHORS = {"left": "la", "center": "ma", "right": "ra"}
+
+
+@lru_cache(maxsize=None)
+def _resolve_font_name(bold: bool) -> Optional[str]:
+    """Find the first font in the fallback list that loads on this system (cached)."""
+    from PIL import ImageFont
+    
+    for font_name in (_BOLD_FONTS if bold else _REGULAR_FONTS):
+        # A font in a well-known directory is found with a stat and loaded by path;
+        # otherwise Pillow's own (recursive) font search is tried for this name
+        font_path = _find_font_file(font_name)
+        for candidate in ((font_path, font_name) if font_path else (font_name,)):
+            try:
+                ImageFont.truetype(candidate, 10, layout_engine=ImageFont.Layout.BASIC)
+            except (OSError, IOError):
+                continue
+            return candidate
+    
+    # None of the known names loaded; ask fontconfig for the system sans-serif
+    font_path = _match_system_font(bold)
+    if font_path:
+        try:
+            ImageFont.truetype(font_path, 10, layout_engine=ImageFont.Layout.BASIC)
+        except (OSError, IOError):
+            return None
+        return font_path
+    return None
+
+
+def _find_font_file(font_name: str) -> Optional[str]:
+    """Return the path of the font file in the first known font directory holding it."""
+    for font_dir in _FONT_DIRS:
+        font_path = os.path.join(font_dir, font_name)
+        if os.path.exists(font_path):
+            return font_path
+    return None
+
+
+def _match_system_font(bold: bool) -> Optional[str]:
+    """Return the file fontconfig's fc-match picks for sans-serif, if available."""
+    if shutil.which("fc-match") is None:
+        return None
+    pattern = "sans-serif:bold" if bold else "sans-serif"
+    try:
+        result = subprocess.run(
+            ["fc-match", "--format=%{file}", pattern],
+            capture_output=True, text=True, timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+@lru_cache(maxsize=64)
+def _load_font(bold: bool, size: int):
+    """Load the resolved font for the given weight and size (cached).
+    
+    The basic layout engine is used: metadata lines need no complex shaping, so
+    skipping Raqm/HarfBuzz avoids a shaping pass on every render and measurement.
+    ImageFont (and its FreeType bindings) is imported here on first use.
+    """
+    from PIL import ImageFont
+    
+    font_name = _resolve_font_name(bold)
+    if font_name is None:
+        return ImageFont.load_default()
+    return ImageFont.truetype(font_name, size, layout_engine=ImageFont.Layout.BASIC)
+
+
+@lru_cache(maxsize=512)
+def _render_text_mask(text: str, bold: bool, size: int, anchor: str) -> Tuple[Image.Image, Tuple[int, int]]:
+    """Rasterize text once into a grayscale coverage mask (cached).
+    
+    Returns the mask and its offset from the anchor point, so repeated strings
+    (camera, lens) are stamped with a bitmap paste instead of re-rendering glyphs.
+    """
+    font = _load_font(bold, size)
+    left, top, right, bottom = font.getbbox(text, anchor=anchor)
+    mask = Image.new('L', (right - left, bottom - top), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, fill=255, font=font, anchor=anchor)
+    return mask, (left, top)
+
+
 class FrameGenerator:
     """Generate instant camera-style frames with EXIF metadata."""
     
-    def __init__(self, style: str = "classic", quality: int = 95, font_scale: float = 1.0, theme: str = "black", layout: str = "compact", cinescope: bool = False, aspect_ratio: float = 2.35):
+    def __init__(self, style: str = "classic", quality: int = 95, font_scale: float = 1.0, theme: str = "black", layout: str = "compact", cinescope: bool = False, aspect_ratio: float = 2.35, optimize: bool = False, max_dimension: Optional[int] = None, fast: bool = False, png_palette: bool = False):
+        # Constructor arguments (the only locals so far), used to rebuild this generator in worker processes
+        self._options = {name: value for name, value in locals().items() if name != 'self'}
+        
         self.style = style
         self.quality = quality
         self.font_scale = font_scale
         self.theme = theme.lower()
         self.layout = layout.lower()
+        self._is_full = self.layout == "full"  # Checked per frame; compact otherwise
         self.cinescope = cinescope
         self.aspect_ratio = aspect_ratio
+        self.optimize = optimize
+        self.max_dimension = max_dimension
+        self.fast = fast
+        self.png_palette = png_palette
         
-        # Set colors based on theme
-        if self.theme == "white":
-            self.frame_color = (255, 255, 255)  # White background
-            self.primary_text_color = (0, 0, 0)     # Black text
-            self.secondary_text_color = (100, 100, 100)  # Dark gray text
-        else:  # black theme (default)
-            self.frame_color = (0, 0, 0)        # Black background
-            self.primary_text_color = (255, 255, 255)   # White text
-            self.secondary_text_color = (180, 180, 180) # Light gray text
+        # Set colors based on theme (black is the default)
+        self.frame_color, self.primary_text_color, self.secondary_text_color = _THEMES.get(self.theme, _THEMES["black"])
         
         # Cinescope bar color (always black for cinematic effect)
         self.cinescope_color = (0, 0, 0)
         
-    def _add_cinescope_bars(self, image: Image.Image, exif_data: ExifData = None) -> tuple[Image.Image, dict]:
-        """Add cinescope bars to create cinematic aspect ratio with EXIF info."""
+        # Fill values for new canvases and bands; Pillow zero-fills a plain 0 with a
+        # memset, several times faster than filling a black (0, 0, 0) tuple per pixel
+        self._frame_fill = 0 if self.frame_color == (0, 0, 0) else self.frame_color
+        self._cinescope_fill = 0 if self.cinescope_color == (0, 0, 0) else self.cinescope_color
+        
+        # Frame layouts keyed by source image size
+        self._layout_cache: Dict[Tuple[int, int], dict] = {}
+        
+        # Frame canvas recycled for the next image of the same size. Only the most
+        # recent size is kept, so mixed-size runs don't hold a canvas per size.
+        self._pooled_canvas: Optional[Image.Image] = None
+        
+    def _add_cinescope_bars(self, image: Image.Image, exif_data: ExifData = None, in_place: bool = False) -> tuple[Image.Image, dict]:
+        """Add cinescope bars to create cinematic aspect ratio with EXIF info.
+        
+        The bars are drawn over a copy of the image, or over the image itself with
+        ``in_place`` when the caller no longer needs the original pixels.
+        """
         if not self.cinescope:
             return image, {}
         
@@ -48,24 +202,20 @@ class FrameGenerator:
         total_bar_height = original_height - target_height
         bar_height = total_bar_height // 2
         
-        # Create new image with cinescope bars
-        cinescope_image = Image.new('RGB', (original_width, original_height), self.cinescope_color)
-        
-        # Calculate position to center the cinematic area
-        y_offset = bar_height
+        # Instead of cropping, we'll overlay black bars on top and bottom; only the
+        # bar rows are written, the picture between them is kept as-is
+        cinescope_image = image if in_place else image.copy()
         
-        # Instead of cropping, we'll overlay black bars on top and bottom
-        cinescope_image.paste(image, (0, 0))
-        
-        # Draw black bars
-        draw = ImageDraw.Draw(cinescope_image)
+        # Fill black bars; a solid-color paste is a straight row fill, no rasterizing.
+        # The top bar includes row bar_height, matching the original inclusive rectangle.
         # Top bar
-        draw.rectangle([0, 0, original_width, bar_height], fill=self.cinescope_color)
+        cinescope_image.paste(self._cinescope_fill, (0, 0, original_width, bar_height + 1))
         # Bottom bar
-        draw.rectangle([0, original_height - bar_height, original_width, original_height], fill=self.cinescope_color)
+        cinescope_image.paste(self._cinescope_fill, (0, original_height - bar_height, original_width, original_height))
         
         # Add EXIF information to cinescope bars if provided
         if exif_data:
+            draw = ImageDraw.Draw(cinescope_image)
             self._draw_cinescope_text(draw, exif_data, original_width, bar_height, original_height - bar_height)
         
         # Return cinescope info for frame generation
@@ -80,25 +230,16 @@ class FrameGenerator:
     
     def _draw_cinescope_text(self, draw: ImageDraw.Draw, exif_data: ExifData, image_width: int, top_bar_height: int, bottom_bar_y: int):
         """Draw EXIF information in cinescope bars."""
-        # Calculate font size based on bar height - much larger
-        base_font_size = max(24, int(top_bar_height * 0.7))  # Use 70% of bar height (increased from 40%)
-        scaled_font_size = int(base_font_size * self.font_scale)
-        font_size = max(20, min(scaled_font_size, 80))  # Larger bounds (was 14-48, now 20-80)
-        
-        # Margins for text positioning
-        margin = 60
-        
         # Only bottom bar: Use same layout as full frame mode (center-aligned)
         bottom_bar_height = top_bar_height  # Same height as top bar
         if bottom_bar_height > 20:  # Only draw if bar is tall enough
             # Combine camera and settings into single centered text blocks like full layout
-            camera_info_text = f"{exif_data.camera_full_name}"
-            if exif_data.lens_model and exif_data.lens_model != "Unknown Lens":
-                camera_info_text += f" / {exif_data.lens_model}"
+            camera_info_text = exif_data.camera_with_lens(" / ")
             
-            settings_info_text = exif_data.format_settings()
-            if exif_data.format_datetime():
-                settings_info_text += f" • {exif_data.format_datetime()}"
+            settings_info_text = exif_data.formatted_settings
+            datetime_text = exif_data.formatted_datetime
+            if datetime_text:
+                settings_info_text += f" • {datetime_text}"
             
             # Calculate font sizes - make them 1.3x larger for cinescope
             base_font_size = max(20, int(bottom_bar_height * 0.3))  # Adjust for cinescope bar height
@@ -117,41 +258,16 @@ class FrameGenerator:
             frame_center_x = image_width // 2
             
             # Draw camera info (larger, bold)
-            self._draw_text_center(draw, camera_info_text, frame_center_x, start_y, large_font_size, bold=True, text_color=(255, 255, 255))
+            self._draw_text(draw, camera_info_text, frame_center_x, start_y, large_font_size, bold=True, text_color=(255, 255, 255), align="center")
             
             # Draw settings info (smaller, lighter)
-            self._draw_text_center(draw, settings_info_text, frame_center_x, start_y + large_line_height, small_font_size, bold=False, text_color=(200, 200, 200))
-    
-    def _get_text_bbox(self, text: str, font_size: int) -> tuple:
-        """Get text bounding box for size calculations."""
-        # Try to get a font for measurement
-        font_names = [
-            "HelveticaNeue-Medium.ttc", "HelveticaNeue-Bold.ttc", "Helvetica-Bold.ttc",
-            "SF-Pro-Display-Medium.otf", "Roboto-Medium.ttf", "Inter-Medium.ttf",
-            "Lato-Bold.ttf", "Arial-Bold.ttf", "DejaVuSans-Bold.ttf"
-        ]
-        
-        font = None
-        for font_name in font_names:
-            try:
-                font = ImageFont.truetype(font_name, font_size)
-                break
-            except (OSError, IOError):
-                continue
-        
-        if font is None:
-            font = ImageFont.load_default()
-        
-        # Create a temporary draw context for measurement
-        temp_img = Image.new('RGB', (1, 1))
-        temp_draw = ImageDraw.Draw(temp_img)
-        return temp_draw.textbbox((0, 0), text, font=font)
+            self._draw_text(draw, settings_info_text, frame_center_x, start_y + large_line_height, small_font_size, bold=False, text_color=(200, 200, 200), align="center")
     
     def _calculate_frame_dimensions(self, image_size: Tuple[int, int]) -> dict:
         """Calculate frame dimensions based on image size."""
         width, height = image_size
         
-        if self.layout == "full":
+        if self._is_full:
             # Full margins on all sides - original instant camera style
             side_margin = int(width * 0.05)   # 5% of width for sides
             top_margin = int(height * 0.05)   # 5% of height for top
@@ -184,281 +300,315 @@ class FrameGenerator:
                 'side_margin': 0               # No side margins for text centering
             }
     
-    def _get_font_size(self, text: str, max_width: int, max_height: int) -> int:
-        """Calculate appropriate font size for given text and area."""
-        # Larger base font size for better readability
-        base_size = max_height // 3  # Use 1/3 of available height
+    def _compute_layout(self, image_size: Tuple[int, int]) -> dict:
+        """Calculate frame dimensions, margins, font sizes and line positions (cached).
         
-        # Calculate based on text length and available width
-        width_based_size = max_width // len(text) * 3  # More generous width calculation
+        Everything here depends only on the image size and the generator settings,
+        so images of the same resolution share one layout.
+        """
+        layout = self._layout_cache.get(image_size)
+        if layout is not None:
+            return layout
         
-        # Use the smaller of the two
-        font_size = min(base_size, width_based_size)
+        layout = self._calculate_frame_dimensions(image_size)
+        new_width = layout['new_size'][0]
         
-        # Set larger bounds for better visibility and apply scale factor
-        scaled_font_size = int(font_size * self.font_scale)
-        return max(int(24 * self.font_scale), min(scaled_font_size, int(72 * self.font_scale)))
-    
-    def _draw_text_left(self, draw: ImageDraw.Draw, text: str, x_position: int, y_position: int, 
-                       font_size: int, bold: bool = False, text_color=None):
-        """Draw text aligned to the left."""
-        # Try more stylish fonts first
-        if bold:
-            font_names = [
-                "HelveticaNeue-Medium.ttc",   # macOS Helvetica Neue Medium
-                "HelveticaNeue-Bold.ttc",     # macOS Helvetica Neue Bold
-                "Helvetica-Bold.ttc",         # macOS Helvetica Bold
-                "SF-Pro-Display-Medium.otf",  # macOS San Francisco Medium
-                "Roboto-Medium.ttf",          # Google Roboto Medium
-                "Inter-Medium.ttf",           # Inter Medium
-                "Lato-Bold.ttf",              # Lato Bold
-                "Arial-Bold.ttf",             # Fallback Arial Bold
-                "DejaVuSans-Bold.ttf"         # Linux fallback Bold
-            ]
-        else:
-            font_names = [
-                "HelveticaNeue-Light.ttc",    # macOS Helvetica Neue Light
-                "Helvetica Neue.ttc",         # macOS Helvetica Neue
-                "Helvetica.ttc",              # macOS Helvetica
-                "SF-Pro-Display-Light.otf",   # macOS San Francisco Light
-                "Roboto-Light.ttf",           # Google Roboto Light
-                "Inter-Light.ttf",            # Inter Light
-                "Lato-Light.ttf",             # Lato Light
-                "Arial.ttf",                  # Fallback Arial
-                "DejaVuSans.ttf"              # Linux fallback
-            ]
-        
-        font = None
-        for font_name in font_names:
-            try:
-                font = ImageFont.truetype(font_name, font_size)
-                break
-            except (OSError, IOError):
-                continue
-        
-        if font is None:
-            font = ImageFont.load_default()
+        # Calculate layout based on layout mode
+        if self._is_full:
+            # Use frame side margins plus additional padding
+            left_margin = layout['side_margin'] + 40
+            right_margin = layout['side_margin'] + 40
+        else:  # compact layout
+            left_margin = 100   # Left margin for left-aligned text
+            right_margin = 100  # Right margin for right-aligned text
         
-        # Get text dimensions
-        bbox = draw.textbbox((0, 0), text, font=font)
+        # Calculate font sizes (smaller to match sample style)
+        base_font_size = max(24, int(layout['text_area_height'] * 0.15))
         
-        color = text_color if text_color is not None else self.primary_text_color
-        draw.text((x_position, y_position), text, fill=color, font=font)
-        return bbox[3] - bbox[1]  # Return text height
-    
-    def _draw_text_center(self, draw: ImageDraw.Draw, text: str, center_x: int, y_position: int, 
-                         font_size: int, bold: bool = False, text_color=None):
-        """Draw text centered horizontally."""
-        # Try more stylish fonts first
-        if bold:
-            font_names = [
-                "HelveticaNeue-Medium.ttc",   # macOS Helvetica Neue Medium
-                "HelveticaNeue-Bold.ttc",     # macOS Helvetica Neue Bold
-                "Helvetica-Bold.ttc",         # macOS Helvetica Bold
-                "SF-Pro-Display-Medium.otf",  # macOS San Francisco Medium
-                "Roboto-Medium.ttf",          # Google Roboto Medium
-                "Inter-Medium.ttf",           # Inter Medium
-                "Lato-Bold.ttf",              # Lato Bold
-                "Arial-Bold.ttf",             # Fallback Arial Bold
-                "DejaVuSans-Bold.ttf"         # Linux fallback Bold
-            ]
+        # Adjust font size based on layout
+        if self._is_full:
+            base_font_size = int(base_font_size * 1.0)  # Normal size for full layout
         else:
-            font_names = [
-                "HelveticaNeue-Light.ttc",    # macOS Helvetica Neue Light
-                "Helvetica Neue.ttc",         # macOS Helvetica Neue
-                "Helvetica.ttc",              # macOS Helvetica
-                "SF-Pro-Display-Light.otf",   # macOS San Francisco Light
-                "Roboto-Light.ttf",           # Google Roboto Light
-                "Inter-Light.ttf",            # Inter Light
-                "Lato-Light.ttf",             # Lato Light
-                "Arial.ttf",                  # Fallback Arial
-                "DejaVuSans.ttf"              # Linux fallback
-            ]
-        
-        font = None
-        for font_name in font_names:
-            try:
-                font = ImageFont.truetype(font_name, font_size)
-                break
-            except (OSError, IOError):
-                continue
+            base_font_size = int(base_font_size * 1.3)  # Larger size for compact layout
+            
+        small_font_size = int(base_font_size * 0.75)  # Second line smaller
         
-        if font is None:
-            font = ImageFont.load_default()
+        # Line spacing: looser for the centered full layout
+        line_spacing = 1.4 if self._is_full else 1.2
+        
+        layout.update({
+            'left_x': left_margin,
+            'right_x': new_width - right_margin,
+            'center_x': new_width // 2,
+            'center_y': layout['text_area_height'] // 2,  # Relative to the text strip
+            'base_font_size': base_font_size,
+            'small_font_size': small_font_size,
+            'large_line_height': int(base_font_size * line_spacing),
+            'small_line_height': int(small_font_size * line_spacing),
+        })
+        self._layout_cache[image_size] = layout
+        return layout
+    
+    def _compose_canvas(self, image: Image.Image, frame_info: dict, reuse: bool = False) -> Image.Image:
+        """Place the image on a frame canvas, filling only the frame bands.
+        
+        The bottom text area is left unfilled; the rendered text strip is pasted there.
+        With ``reuse``, the pooled canvas is recycled when it has the same size: the
+        photo and the text strip overwrite their areas, so the margins only need
+        filling once. A canvas of a new size replaces the pooled one.
+        """
+        new_width, new_height = frame_info['new_size']
+        x_offset, y_offset = frame_info['image_position']
+        width, height = image.size
+        
+        canvas = self._pooled_canvas if reuse else None
+        if canvas is not None and canvas.size == (new_width, new_height):
+            canvas.paste(image, (x_offset, y_offset))
+            return canvas
+        
+        # Skip the initial fill; the photo, the bands below and the text strip cover every pixel
+        canvas = Image.new('RGB', (new_width, new_height), None)
+        canvas.paste(image, (x_offset, y_offset))
+        
+        frame_bands = [
+            (0, 0, new_width, y_offset),                                    # Top margin
+            (0, y_offset, x_offset, y_offset + height),                     # Left margin
+            (x_offset + width, y_offset, new_width, y_offset + height),     # Right margin
+        ]
+        for left, top, right, bottom in frame_bands:
+            if right > left and bottom > top:
+                canvas.paste(self._frame_fill, (left, top, right, bottom))
         
-        # Get text dimensions
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = bbox[2] - bbox[0]
+        if reuse:
+            self._pooled_canvas = canvas
+        return canvas
+    
+    def _draw_text(self, draw: ImageDraw.Draw, text: str, x_position: int, y_position: int,
+                   font_size: int, bold: bool = False, text_color=None, align: str = "left"):
+        """Draw text aligned "left", "center" or "right" of the given x position.
         
-        # Position text centered
-        x_position = center_x - text_width // 2
+        The glyphs come from the cached text mask, so no separate measuring pass is needed.
+        """
+        mask, (offset_x, offset_y) = _render_text_mask(text, bold, font_size, _ANCHORS[align])
         
         color = text_color if text_color is not None else self.primary_text_color
-        draw.text((x_position, y_position), text, fill=color, font=font)
-        return bbox[3] - bbox[1]  # Return text height
+        draw.bitmap((x_position + offset_x, y_position + offset_y), mask, fill=color)
     
-    def _draw_text_right(self, draw: ImageDraw.Draw, text: str, right_x: int, y_position: int, 
-                        font_size: int, bold: bool = False, text_color=None):
-        """Draw text aligned to the right."""
-        # Try more stylish fonts first
-        if bold:
-            font_names = [
-                "HelveticaNeue-Medium.ttc",   # macOS Helvetica Neue Medium
-                "HelveticaNeue-Bold.ttc",     # macOS Helvetica Neue Bold
-                "Helvetica-Bold.ttc",         # macOS Helvetica Bold
-                "SF-Pro-Display-Medium.otf",  # macOS San Francisco Medium
-                "Roboto-Medium.ttf",          # Google Roboto Medium
-                "Inter-Medium.ttf",           # Inter Medium
-                "Lato-Bold.ttf",              # Lato Bold
-                "Arial-Bold.ttf",             # Fallback Arial Bold
-                "DejaVuSans-Bold.ttf"         # Linux fallback Bold
-            ]
-        else:
-            font_names = [
-                "HelveticaNeue-Light.ttc",    # macOS Helvetica Neue Light
-                "Helvetica Neue.ttc",         # macOS Helvetica Neue
-                "Helvetica.ttc",              # macOS Helvetica
-                "SF-Pro-Display-Light.otf",   # macOS San Francisco Light
-                "Roboto-Light.ttf",           # Google Roboto Light
-                "Inter-Light.ttf",            # Inter Light
-                "Lato-Light.ttf",             # Lato Light
-                "Arial.ttf",                  # Fallback Arial
-                "DejaVuSans.ttf"              # Linux fallback
-            ]
-        
-        font = None
-        for font_name in font_names:
+    def _draw_text_strip(self, text_ops: list, size: Tuple[int, int]) -> Image.Image:
+        """Render (align, text, x, y, font_size, bold, color) operations onto a frame-colored strip."""
+        text_strip = Image.new('RGB', size, self._frame_fill)
+        draw = ImageDraw.Draw(text_strip)
+        for align, text, x_position, y_position, font_size, bold, color in text_ops:
+            self._draw_text(draw, text, x_position, y_position, font_size, bold=bold, text_color=color, align=align)
+        return text_strip
+    
+    def _save(self, image: Image.Image, output_path: str):
+        """Save the image, skipping the extra Huffman optimization pass unless requested.
+        
+        Fast mode always uses 4:2:0 chroma subsampling and never optimizes, trading a
+        little color fidelity for the quickest libjpeg-turbo encode.
+        """
+        # Resolve the format up front so an unknown extension fails before the file is created
+        extension = os.path.splitext(output_path)[1].lower()
+        image_format = Image.registered_extensions().get(extension)
+        if image_format is None:
+            raise ValueError(f"unknown file extension: {extension}")
+        
+        # Palette PNGs are roughly a third of the size for flat, screenshot-like images
+        if image_format == 'PNG' and self.png_palette:
+            if features.check_feature('libimagequant'):
+                method = Image.Quantize.LIBIMAGEQUANT
+            else:
+                method = Image.Quantize.FASTOCTREE
+            image = image.quantize(256, method=method, dither=Image.Dither.FLOYDSTEINBERG)
+        
+        # Unbuffered file: the encoder's chunks go straight to the OS with no extra copy
+        with open(output_path, 'wb', buffering=0) as output_file:
             try:
-                font = ImageFont.truetype(font_name, font_size)
-                break
-            except (OSError, IOError):
-                continue
-        
-        if font is None:
-            font = ImageFont.load_default()
-        
-        # Get text dimensions
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = bbox[2] - bbox[0]
-        
-        # Position text so it ends at right_x
-        x_position = right_x - text_width
+                image.save(
+                    output_file,
+                    image_format,
+                    quality=self.quality,
+                    optimize=self.optimize and not self.fast,
+                    progressive=False,
+                    subsampling=0 if self.quality >= 90 and not self.fast else 2,  # Keep full chroma at high quality
+                )
+            except BaseException:
+                # Like Pillow when it opens the file itself, don't leave a partial output behind
+                output_file.close()
+                os.remove(output_path)
+                raise
+    
+    def generate_batch(self, tasks: Iterable[Tuple[Union[str, Image.Image], ExifData, str]],
+                       background_save: bool = False) -> List[str]:
+        """Generate framed images for (image, exif_data, output_path) tasks in sequence."""
+        if not background_save:
+            # Same-size frames recycle one canvas
+            try:
+                return [
+                    self.generate_frame(image, exif_data, output_path, reuse_canvas=True)
+                    for image, exif_data, output_path in tasks
+                ]
+            finally:
+                self._pooled_canvas = None
+        
+        # Encode on writer threads (Pillow releases the GIL) while the next frame is
+        # composed. Each frame gets its own canvas, as a queued save may still read one.
+        results = []
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=2) as writer:
+            for image, exif_data, output_path in tasks:
+                # Keep at most two frames queued for encoding so memory stays bounded
+                if len(pending) >= 2:
+                    results.append(pending.popleft().result())
+                framed_image = self.render_frame(image, exif_data)
+                pending.append(writer.submit(self.save_frame, framed_image, output_path))
+            results.extend(future.result() for future in pending)
+        return results
+    
+    def save_frame(self, framed_image: Image.Image, output_path: str) -> str:
+        """Save an image from render_frame() and return its path."""
+        self._save(framed_image, output_path)
+        return output_path
+    
+    def generate_frames(self, tasks: Iterable[tuple], jobs: Optional[int] = None,
+                        frame_func: Optional[Callable[["FrameGenerator", tuple], object]] = None) -> list:
+        """Frame (image_path, exif_data or None, output_path) tasks in worker processes.
+        
+        ``frame_func(generator, task)``, a module-level function, may replace the per-task work.
+        """
+        frame_func = frame_func or frame_image_file
+        tasks = list(tasks)
+        workers = min(jobs or os.cpu_count() or 1, len(tasks))
+        if workers <= 1:
+            try:
+                return [frame_func(self, task) for task in tasks]
+            finally:
+                self._pooled_canvas = None
+        
+        chunksize = max(1, len(tasks) // (4 * workers))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self._options, frame_func),
+        ) as executor:
+            return list(executor.map(_run_worker_task, tasks, chunksize=chunksize))
+    
+    def generate_frame(self, image: Union[str, Image.Image], exif_data: ExifData, output_path: str,
+                       reuse_canvas: bool = False):
+        """Generate framed image with EXIF metadata and save it to ``output_path``."""
+        framed_image = self.render_frame(image, exif_data, reuse_canvas=reuse_canvas)
         
-        color = text_color if text_color is not None else self.primary_text_color
-        draw.text((x_position, y_position), text, fill=color, font=font)
-        return bbox[3] - bbox[1]  # Return text height
+        # Save with specified quality
+        return self.save_frame(framed_image, output_path)
     
-    def generate_frame(self, image_path: str, exif_data: ExifData, output_path: str):
-        """Generate framed image with EXIF metadata."""
-        # Open original image
-        original_image = Image.open(image_path)
+    def render_frame(self, image: Union[str, Image.Image], exif_data: ExifData,
+                     reuse_canvas: bool = False, in_place: bool = False) -> Image.Image:
+        """Build the framed image from a path or open image without saving it."""
+        # Open original image unless the caller already has it open. Images created
+        # here are closed as soon as their pixels are copied, so the decoded source
+        # doesn't stay resident next to the framed image during encoding.
+        if isinstance(image, Image.Image):
+            original_image = image
+            owns_image = False
+        else:
+            original_image = Image.open(image)
+            owns_image = True
+        
+        # Downscale large inputs before decoding; for JPEGs thumbnail() uses draft()
+        # so libjpeg decodes directly at 1/2, 1/4 or 1/8 scale. A caller's image is
+        # only shrunk in place when it hands it over with ``in_place``; otherwise a
+        # copy is downscaled and the caller's image is left untouched.
+        if self.max_dimension and max(original_image.size) > self.max_dimension:
+            if not (owns_image or in_place):
+                original_image, owns_image = original_image.copy(), True
+            original_image.thumbnail((self.max_dimension, self.max_dimension))
+        
+        # Bake the EXIF orientation into the pixels so the frame is built around the
+        # photo as it is meant to be viewed; the output carries no orientation tag.
+        # Upright images (the common case) skip the transpose copy entirely.
+        if original_image.getexif().get(ExifTags.Base.Orientation, 1) != 1:
+            upright_image = ImageOps.exif_transpose(original_image)
+            if owns_image:
+                original_image.close()
+            original_image, owns_image = upright_image, True
+        
+        # Normalise to RGB once; already-RGB images (the common JPEG case) are used as-is
+        if original_image.mode != 'RGB':
+            rgb_image = original_image.convert('RGB')
+            if owns_image:
+                original_image.close()
+            original_image, owns_image = rgb_image, True
         
         # Apply cinescope bars if enabled
-        cinescope_info = {}
         if self.cinescope:
-            original_image, cinescope_info = self._add_cinescope_bars(original_image, exif_data)
-        
-        # Try to detect original image quality to preserve it
-        original_quality = 95  # Default high quality
-        try:
-            # Check if the original image has quality info
-            if hasattr(original_image, 'quantization'):
-                # Estimate quality from quantization tables (rough estimate)
-                original_quality = 95  # Conservative high quality for preservation
-        except:
-            original_quality = 95
-        
-        # If cinescope is enabled and no additional frame is needed, return the cinescope image
-        if self.cinescope and cinescope_info:
-            # Save cinescope image directly without additional frame
-            original_image.save(output_path, quality=self.quality, optimize=True)
-            return output_path
-        
-        # Calculate frame dimensions
-        frame_info = self._calculate_frame_dimensions(original_image.size)
-        
-        # Create new image with frame
-        framed_image = Image.new('RGB', frame_info['new_size'], self.frame_color)
+            # Images opened or converted here are not needed afterwards, so the
+            # bars are drawn straight onto them
+            cinescope_image, cinescope_info = self._add_cinescope_bars(original_image, exif_data, in_place=owns_image)
+            
+            # If cinescope bars were added, no additional frame is needed
+            if cinescope_info:
+                return cinescope_image
         
-        # Paste original image onto frame without recompression
-        framed_image.paste(original_image, frame_info['image_position'])
+        # Calculate frame dimensions and text positions
+        frame_info = self._compute_layout(original_image.size)
         
-        # Add metadata text
-        draw = ImageDraw.Draw(framed_image)
+        # Create new image with frame, pasting original image without recompression.
+        # A recycled canvas is overwritten by the next same-size frame.
+        framed_image = self._compose_canvas(original_image, frame_info, reuse=reuse_canvas)
+        if owns_image:
+            original_image.close()
         
-        # Calculate layout based on layout mode
-        if self.layout == "full":
-            # Use frame side margins plus additional padding
-            left_margin = frame_info['side_margin'] + 40
-            right_margin = frame_info['side_margin'] + 40
-        else:  # compact layout
-            left_margin = 100   # Left margin for left-aligned text
-            right_margin = 100  # Right margin for right-aligned text
+        # Metadata text is collected as draw operations and rendered onto a strip
+        # covering just the text area, which is then pasted in
+        text_ops = []
         
         # Left side: Camera and Lens info
-        camera_lens_text = f"{exif_data.camera_full_name}"
-        if exif_data.lens_model and exif_data.lens_model != "Unknown Lens":
-            camera_lens_text += f"\n{exif_data.lens_model}"
+        camera_lens_text = exif_data.camera_with_lens("\n")
         
         # Right side: Settings and DateTime
-        settings_text = exif_data.format_settings()
-        datetime_text = exif_data.format_datetime()
+        settings_text = exif_data.formatted_settings
+        datetime_text = exif_data.formatted_datetime
         if datetime_text:
             right_side_text = f"{settings_text}\n{datetime_text}"
         else:
             right_side_text = settings_text
         
-        # Calculate font sizes (smaller to match sample style)
-        base_font_size = max(24, int(frame_info['text_area_height'] * 0.15))
-        
-        # Adjust font size based on layout
-        if self.layout == "full":
-            base_font_size = int(base_font_size * 1.0)  # Normal size for full layout
-        else:
-            base_font_size = int(base_font_size * 1.3)  # Larger size for compact layout
-            
-        small_font_size = int(base_font_size * 0.75)  # Second line smaller
+        base_font_size = frame_info['base_font_size']
+        small_font_size = frame_info['small_font_size']
+        large_line_height = frame_info['large_line_height']
+        small_line_height = frame_info['small_line_height']
+        text_area_center_y = frame_info['center_y']
         
         # Use theme colors
         primary_color = self.primary_text_color
         secondary_color = self.secondary_text_color
         
-        # Calculate vertical positioning
-        text_area_center_y = frame_info['text_area_start'] + frame_info['text_area_height'] // 2
-        
-        if self.layout == "full":
+        if self._is_full:
             # Full layout: center-aligned text like original instant camera style
             # Combine camera and settings into single centered text blocks
-            camera_info_text = f"{exif_data.camera_full_name}"
-            if exif_data.lens_model and exif_data.lens_model != "Unknown Lens":
-                camera_info_text += f" / {exif_data.lens_model}"
+            camera_info_text = exif_data.camera_with_lens(" / ")
             
-            settings_info_text = exif_data.format_settings()
-            if exif_data.format_datetime():
-                settings_info_text += f" • {exif_data.format_datetime()}"
+            settings_info_text = settings_text
+            if datetime_text:
+                settings_info_text += f" • {datetime_text}"
             
             # Calculate text positioning for center alignment
-            large_line_height = int(base_font_size * 1.4)
-            small_line_height = int(small_font_size * 1.4)
             total_height = large_line_height + small_line_height
             
             start_y = text_area_center_y - total_height // 2
-            frame_center_x = frame_info['new_size'][0] // 2
+            frame_center_x = frame_info['center_x']
             
             # Draw camera info (larger, bold)
-            self._draw_text_center(draw, camera_info_text, frame_center_x, start_y, base_font_size, bold=True, text_color=primary_color)
+            text_ops.append(('center', camera_info_text, frame_center_x, start_y, base_font_size, True, primary_color))
             
             # Draw settings info (smaller, lighter)
-            self._draw_text_center(draw, settings_info_text, frame_center_x, start_y + large_line_height, small_font_size, bold=False, text_color=secondary_color)
+            text_ops.append(('center', settings_info_text, frame_center_x, start_y + large_line_height, small_font_size, False, secondary_color))
             
         else:
             # Compact layout: left/right aligned text
             camera_lines = camera_lens_text.split('\n')
             
-            # Calculate actual text heights for proper centering
-            large_line_height = int(base_font_size * 1.2)
-            small_line_height = int(small_font_size * 1.2)
-            
             # Calculate total height for left side
             total_left_height = 0
             if len(camera_lines) > 0:
@@ -471,10 +621,10 @@ class FrameGenerator:
             
             for i, line in enumerate(camera_lines):
                 if i == 0:  # First line (camera) - larger, bold, white
-                    self._draw_text_left(draw, line, left_margin, current_y, base_font_size, bold=True, text_color=primary_color)
+                    text_ops.append(('left', line, frame_info['left_x'], current_y, base_font_size, True, primary_color))
                     current_y += large_line_height
                 else:  # Second line (lens) - smaller, light, gray
-                    self._draw_text_left(draw, line, left_margin, current_y, small_font_size, bold=False, text_color=secondary_color)
+                    text_ops.append(('left', line, frame_info['left_x'], current_y, small_font_size, False, secondary_color))
                     current_y += small_line_height
             
             # Draw right side text (settings and datetime)
@@ -492,13 +642,47 @@ class FrameGenerator:
             
             for i, line in enumerate(right_lines):
                 if i == 0:  # First line (settings) - larger, bold, white
-                    self._draw_text_right(draw, line, frame_info['new_size'][0] - right_margin, current_y, base_font_size, bold=True, text_color=primary_color)
+                    text_ops.append(('right', line, frame_info['right_x'], current_y, base_font_size, True, primary_color))
                     current_y += large_line_height
                 else:  # Second line (datetime) - smaller, light, gray
-                    self._draw_text_right(draw, line, frame_info['new_size'][0] - right_margin, current_y, small_font_size, bold=False, text_color=secondary_color)
+                    text_ops.append(('right', line, frame_info['right_x'], current_y, small_font_size, False, secondary_color))
                     current_y += small_line_height
         
-        # Save with specified quality
-        framed_image.save(output_path, quality=self.quality, optimize=True)
+        # Repeated lines (camera, lens, settings) reuse their cached text masks
+        text_strip = self._draw_text_strip(
+            text_ops, (frame_info['new_size'][0], frame_info['text_area_height'])
+        )
+        framed_image.paste(text_strip, (0, frame_info['text_area_start']))
         
-        return output_path
\ No newline at end of file
+        return framed_image
+
+
+def frame_image_file(generator: FrameGenerator, task: Tuple[str, Optional[ExifData], str]) -> str:
+    """Frame one (image_path, exif_data, output_path) task, opening the file once.
+    
+    EXIF is read from the open image when ``exif_data`` is None, and the source is
+    closed before the frame is encoded.
+    """
+    image_path, exif_data, output_path = task
+    with Image.open(image_path) as image:
+        if exif_data is None:
+            exif_data = ExifReader(image).extract_exif_data()
+        framed_image = generator.render_frame(image, exif_data, reuse_canvas=True, in_place=True)
+    return generator.save_frame(framed_image, output_path)
+
+
+# Generator and per-task function shared by every task a generate_frames() worker handles
+_worker_generator: Optional[FrameGenerator] = None
+_worker_frame_func: Optional[Callable[[FrameGenerator, tuple], object]] = None
+
+
+def _init_worker(options: dict, frame_func: Callable[[FrameGenerator, tuple], object]):
+    """Create the frame generator used for every task in this worker process."""
+    global _worker_generator, _worker_frame_func
+    _worker_generator = FrameGenerator(**options)
+    _worker_frame_func = frame_func
+
+
+def _run_worker_task(task: tuple):
+    """Run one generate_frames() task in a worker process."""
+    return _worker_frame_func(_worker_generator, task)
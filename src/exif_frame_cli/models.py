@@ -1,12 +1,18 @@
 """Data models for EXIF information."""
 
 from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True)
 class ExifData:
-    """Container for EXIF metadata extracted from an image."""
+    """Container for EXIF metadata extracted from an image.
+    
+    Instances are immutable, so the formatted display strings are computed once
+    and cached.
+    """
     
     camera_make: Optional[str] = None
     camera_model: Optional[str] = None
@@ -33,8 +39,18 @@ class ExifData:
         """Get the lens name for display."""
         return self.lens_model or "Unknown Lens"
     
-    def format_settings(self) -> str:
-        """Format technical settings as a single line."""
+    def camera_with_lens(self, sep: str) -> str:
+        """Get the camera name followed by the lens model, joined with ``sep``.
+        
+        The lens is left out when it is not known.
+        """
+        if self.lens_model and self.lens_model != "Unknown Lens":
+            return f"{self.camera_full_name}{sep}{self.lens_model}"
+        return self.camera_full_name
+    
+    @cached_property
+    def formatted_settings(self) -> str:
+        """Technical settings as a single line (cached)."""
         settings = []
         
         if self.focal_length:
@@ -48,16 +64,24 @@ class ExifData:
             
         return " ".join(settings) if settings else "Settings Unknown"
     
-    def format_datetime(self) -> str:
-        """Format datetime for display."""
+    @cached_property
+    def formatted_datetime(self) -> str:
+        """Datetime for display (cached)."""
         if not self.datetime_original:
             return ""
         
         try:
             # Parse the EXIF datetime format: "YYYY:MM:DD HH:MM:SS"
-            from datetime import datetime
             dt = datetime.strptime(self.datetime_original, "%Y:%m:%d %H:%M:%S")
             # Format like the sample: "20:13:02 2024.12.09"
             return dt.strftime("%H:%M:%S %Y.%m.%d")
         except:
-            return self.datetime_original
\ No newline at end of file
+            return self.datetime_original
+    
+    def format_settings(self) -> str:
+        """Format technical settings as a single line."""
+        return self.formatted_settings
+    
+    def format_datetime(self) -> str:
+        """Format datetime for display."""
+        return self.formatted_datetime
@@ -0,0 +1,2 @@
+# test_with_exif.py is a manual demo script (it needs piexif and writes files on import)
+collect_ignore = ["test_with_exif.py"]
@@ -0,0 +1,93 @@
+"""Tests for the exif-frame-cli command-line interface."""
+
+from click.testing import CliRunner
+from PIL import Image
+
+from exif_frame_cli.cli import main
+
+
+def make_image(path, size=(120, 80), image_format=None):
+    """Write a small solid-color image and return its path as a string."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new('RGB', size, (40, 120, 60)).save(path, image_format)
+    return str(path)
+
+
+def run(*args):
+    return CliRunner().invoke(main, list(args))
+
+
+def test_single_file_default_output(tmp_path):
+    input_file = make_image(tmp_path / "photo.jpg")
+
+    result = run(input_file)
+
+    assert result.exit_code == 0, result.output
+    with Image.open(tmp_path / "photo_framed.jpg") as framed:
+        assert framed.width == 120
+        assert framed.height > 80  # Bottom text area added
+
+
+def test_batch_writes_into_output_directory(tmp_path):
+    inputs = [make_image(tmp_path / name) for name in ("a.jpg", "b.jpg")]
+    output_dir = tmp_path / "out"
+
+    result = run(*inputs, "--output", str(output_dir), "--jobs", "1")
+
+    assert result.exit_code == 0, result.output
+    assert sorted(p.name for p in output_dir.iterdir()) == ["a_framed.jpg", "b_framed.jpg"]
+
+
+def test_batch_in_worker_processes(tmp_path):
+    inputs = [make_image(tmp_path / f"{i}.jpg") for i in range(3)]
+    output_dir = tmp_path / "out"
+
+    result = run(*inputs, "-o", str(output_dir), "--jobs", "2")
+
+    assert result.exit_code == 0, result.output
+    assert len(list(output_dir.iterdir())) == 3
+
+
+def test_partial_failure_exits_with_status_1(tmp_path):
+    good = make_image(tmp_path / "good.jpg")
+    bad = tmp_path / "bad.jpg"
+    bad.write_text("not an image")
+
+    result = run(good, str(bad), "-o", str(tmp_path / "out"), "--jobs", "1")
+
+    assert result.exit_code == 1
+    assert "is not a valid image file" in result.output
+    assert (tmp_path / "out" / "good_framed.jpg").exists()
+
+
+def test_format_without_sniffed_signature_is_opened_by_pillow(tmp_path):
+    input_file = make_image(tmp_path / "photo.ppm", image_format="PPM")
+
+    result = run(input_file)
+
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "photo_framed.ppm").exists()
+
+
+def test_rejects_inputs_mapping_to_the_same_output(tmp_path):
+    first = make_image(tmp_path / "d1" / "a.jpg")
+    second = make_image(tmp_path / "d2" / "a.jpg")
+    output_dir = tmp_path / "out"
+
+    result = run(first, second, "-o", str(output_dir))
+
+    assert result.exit_code == 1
+    assert "would both be written to" in result.output
+    assert not output_dir.exists()
+
+
+def test_rejects_output_that_overwrites_an_input(tmp_path):
+    source = make_image(tmp_path / "x.jpg")
+    earlier_output = make_image(tmp_path / "x_framed.jpg")
+    before = (tmp_path / "x_framed.jpg").read_bytes()
+
+    result = run(source, earlier_output)
+
+    assert result.exit_code == 1
+    assert "would overwrite input" in result.output
+    assert (tmp_path / "x_framed.jpg").read_bytes() == before
@@ -0,0 +1,39 @@
+"""Tests for FrameGenerator batch helpers."""
+
+from PIL import Image, ImageChops
+
+from exif_frame_cli.frame_generator import FrameGenerator
+from exif_frame_cli.models import ExifData
+
+
+def make_image(path, color, size=(160, 120)):
+    Image.new('RGB', size, color).save(path)
+    return str(path)
+
+
+def test_background_save_matches_serial_batch(tmp_path):
+    exif_data = ExifData(camera_make="SONY", camera_model="ILCE-7CM2", iso="200")
+    inputs = [make_image(tmp_path / f"in{i}.png", (i * 60, 90, 30)) for i in range(4)]
+
+    serial = FrameGenerator().generate_batch(
+        [(path, exif_data, str(tmp_path / f"serial{i}.png")) for i, path in enumerate(inputs)]
+    )
+    background = FrameGenerator().generate_batch(
+        [(path, exif_data, str(tmp_path / f"background{i}.png")) for i, path in enumerate(inputs)],
+        background_save=True,
+    )
+
+    assert background == [str(tmp_path / f"background{i}.png") for i in range(4)]
+    for serial_path, background_path in zip(serial, background):
+        with Image.open(serial_path) as expected, Image.open(background_path) as actual:
+            assert ImageChops.difference(expected, actual).getbbox() is None
+
+
+def test_max_dimension_leaves_caller_image_untouched(tmp_path):
+    generator = FrameGenerator(max_dimension=100)
+
+    with Image.open(make_image(tmp_path / "in.jpg", (200, 30, 30), size=(300, 200))) as image:
+        framed = generator.render_frame(image, ExifData())
+        assert image.size == (300, 200)
+
+    assert framed.width == 100